@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+from functools import partial
 from itertools import chain
 import logging
 import ssl
@@ -45,13 +46,14 @@ from .const import (
     UNASSIGNED_AREA,
 )
 from .device_trigger import (
-    DEVICE_TYPE_SUBTYPE_MAP_TO_LIP,
+    DEVICE_TYPE_LEAP_TO_LIP,
     KEYPAD_LEAP_BUTTON_NAME_OVERRIDE,
     LEAP_TO_DEVICE_TYPE_SUBTYPE_MAP,
     LUTRON_BUTTON_TRIGGER_SCHEMA,
 )
 from .models import (
     LUTRON_BUTTON_LEAP_BUTTON_NUMBER,
+    LUTRON_BUTTON_PARENT_KEYPAD,
     LUTRON_KEYPAD_AREA_NAME,
     LUTRON_KEYPAD_BUTTONS,
     LUTRON_KEYPAD_DEVICE_REGISTRY_DEVICE_ID,
@@ -102,22 +104,22 @@ PLATFORMS = [
 
 async def async_setup(hass: HomeAssistant, base_config: ConfigType) -> bool:
     """Set up the Lutron component."""
-    if DOMAIN in base_config:
-        bridge_configs = base_config[DOMAIN]
-        for config in bridge_configs:
-            hass.async_create_task(
-                hass.config_entries.flow.async_init(
-                    DOMAIN,
-                    context={"source": config_entries.SOURCE_IMPORT},
-                    # extract the config keys one-by-one just to be explicit
-                    data={
-                        CONF_HOST: config[CONF_HOST],
-                        CONF_KEYFILE: config[CONF_KEYFILE],
-                        CONF_CERTFILE: config[CONF_CERTFILE],
-                        CONF_CA_CERTS: config[CONF_CA_CERTS],
-                    },
-                )
+    for config in base_config.get(DOMAIN, ()):
+        hass.async_create_task(
+            hass.config_entries.flow.async_init(
+                DOMAIN,
+                # Each flow needs its own context, flows store their
+                # unique_id and title placeholders in it
+                context={"source": config_entries.SOURCE_IMPORT},
+                # extract the config keys one-by-one just to be explicit
+                data={
+                    CONF_HOST: config[CONF_HOST],
+                    CONF_KEYFILE: config[CONF_KEYFILE],
+                    CONF_CERTFILE: config[CONF_CERTFILE],
+                    CONF_CA_CERTS: config[CONF_CA_CERTS],
+                },
             )
+        )
 
     return True
 
@@ -129,13 +131,14 @@ async def _async_migrate_unique_ids(
 
     dev_reg = dr.async_get(hass)
     bridge_unique_id = entry.unique_id
+    migrated_prefix = f"occupancygroup_{bridge_unique_id}"
 
     @callback
     def _async_migrator(entity_entry: er.RegistryEntry) -> dict[str, Any] | None:
         if not (unique_id := entity_entry.unique_id):
             return None
         if not unique_id.startswith("occupancygroup_") or unique_id.startswith(
-            f"occupancygroup_{bridge_unique_id}"
+            migrated_prefix
         ):
             return None
         sensor_id = unique_id.split("_")[1]
@@ -144,7 +147,7 @@ async def _async_migrate_unique_ids(
             dev_reg.async_update_device(
                 dev_entry.id, new_identifiers={(DOMAIN, new_unique_id)}
             )
-        return {"new_unique_id": f"occupancygroup_{bridge_unique_id}_{sensor_id}"}
+        return {"new_unique_id": new_unique_id}
 
     await er.async_migrate_entries(hass, entry.entry_id, _async_migrator)
 
@@ -186,20 +189,27 @@ async def async_setup_entry(
 
     bridge_devices = bridge.get_devices()
     bridge_device = bridge_devices[BRIDGE_DEVICE_ID]
+    bridge_unique_id = serial_to_unique_id(bridge_device["serial"])
 
     if not entry.unique_id:
-        hass.config_entries.async_update_entry(
-            entry, unique_id=serial_to_unique_id(bridge_device["serial"])
-        )
+        hass.config_entries.async_update_entry(entry, unique_id=bridge_unique_id)
+
+    # Full area names keyed by area id, shared by everything built from this
+    # bridge so each area is only resolved once.
+    area_names: dict[str, str] = {}
 
-    _async_register_bridge_device(hass, entry_id, bridge_device, bridge)
+    _async_register_bridge_device(hass, entry_id, bridge_device, bridge, area_names)
 
-    keypad_data = _async_setup_keypads(hass, entry_id, bridge, bridge_device)
+    keypad_data = _async_setup_keypads(
+        hass, entry_id, bridge, bridge_devices, area_names
+    )
 
     # Store this bridge (keyed by entry_id) so it can be retrieved by the
     # platforms we're setting up.
 
-    entry.runtime_data = LutronCasetaData(bridge, bridge_device, keypad_data)
+    entry.runtime_data = LutronCasetaData(
+        bridge, bridge_device, bridge_unique_id, keypad_data, area_names
+    )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -208,7 +218,11 @@ async def async_setup_entry(
 
 @callback
 def _async_register_bridge_device(
-    hass: HomeAssistant, config_entry_id: str, bridge_device: dict, bridge: Smartbridge
+    hass: HomeAssistant,
+    config_entry_id: str,
+    bridge_device: dict,
+    bridge: Smartbridge,
+    area_names: dict[str, str],
 ) -> None:
     """Register the bridge device in the device registry."""
     device_registry = dr.async_get(hass)
@@ -222,7 +236,7 @@ def _async_register_bridge_device(
         configuration_url="https://device-login.lutron.com",
     )
 
-    area = area_name_from_id(bridge.areas, bridge_device["area"])
+    area = area_name_from_id(bridge.areas, bridge_device["area"], area_names)
     if area != UNASSIGNED_AREA:
         device_args["suggested_area"] = area
 
@@ -234,13 +248,14 @@ def _async_setup_keypads(
     hass: HomeAssistant,
     config_entry_id: str,
     bridge: Smartbridge,
-    bridge_device: dict[str, str | int],
+    bridge_devices: dict[str, dict[str, str | int]],
+    area_names: dict[str, str],
 ) -> LutronKeypadData:
     """Register keypad devices (Keypads and Pico Remotes) in the device registry."""
 
     device_registry = dr.async_get(hass)
 
-    bridge_devices: dict[str, dict[str, str | int]] = bridge.get_devices()
+    bridge_device = bridge_devices[BRIDGE_DEVICE_ID]
     bridge_buttons: dict[str, dict[str, str | int]] = bridge.buttons
 
     dr_device_id_to_keypad: dict[str, LutronKeypad] = {}
@@ -262,7 +277,11 @@ def _async_setup_keypads(
         if not (keypad := keypads.get(keypad_lutron_device_id)):
             # First time seeing this keypad, build keypad data and store in keypads
             keypad = keypads[keypad_lutron_device_id] = _async_build_lutron_keypad(
-                bridge, bridge_device, bridge_keypad, keypad_lutron_device_id
+                bridge,
+                bridge_device,
+                bridge_keypad,
+                keypad_lutron_device_id,
+                area_names,
             )
 
             # Register the keypad device
@@ -271,9 +290,10 @@ def _async_setup_keypads(
             )
             keypad[LUTRON_KEYPAD_DEVICE_REGISTRY_DEVICE_ID] = dr_device.id
             dr_device_id_to_keypad[dr_device.id] = keypad
+            keypad_button_names_to_leap[keypad_lutron_device_id] = {}
+            leap_to_keypad_button_names[keypad_lutron_device_id] = {}
 
         button_name = _get_button_name(keypad, bridge_button)
-        keypad_lutron_device_id = keypad[LUTRON_KEYPAD_LUTRON_DEVICE_ID]
 
         # Add button to parent keypad, and build keypad_buttons and keypad_button_names_to_leap
         keypad_buttons[button_lutron_device_id] = LutronButton(
@@ -286,14 +306,12 @@ def _async_setup_keypads(
 
         keypad[LUTRON_KEYPAD_BUTTONS].append(button_lutron_device_id)
 
-        button_name_to_leap = keypad_button_names_to_leap.setdefault(
-            keypad_lutron_device_id, {}
+        keypad_button_names_to_leap[keypad_lutron_device_id][button_name] = (
+            leap_button_number
         )
-        button_name_to_leap[button_name] = leap_button_number
-        leap_to_button_name = leap_to_keypad_button_names.setdefault(
-            keypad_lutron_device_id, {}
+        leap_to_keypad_button_names[keypad_lutron_device_id][leap_button_number] = (
+            button_name
         )
-        leap_to_button_name[leap_button_number] = button_name
 
     keypad_trigger_schemas = _async_build_trigger_schemas(keypad_button_names_to_leap)
 
@@ -338,10 +356,11 @@ def _async_build_lutron_keypad(
     bridge_device: dict[str, Any],
     bridge_keypad: dict[str, Any],
     keypad_device_id: int,
+    area_names: dict[str, str],
 ) -> LutronKeypad:
     # First time seeing this keypad, build keypad data and store in keypads
-    area_name = area_name_from_id(bridge.areas, bridge_keypad["area"])
-    keypad_name = bridge_keypad["name"].split("_")[-1]
+    area_name = area_name_from_id(bridge.areas, bridge_keypad["area"], area_names)
+    keypad_name = bridge_keypad["name"].rpartition("_")[2]
     keypad_serial = _handle_none_keypad_serial(bridge_keypad, bridge_device["serial"])
     device_info = DeviceInfo(
         name=f"{area_name} {keypad_name}",
@@ -388,14 +407,9 @@ def _get_button_name(keypad: LutronKeypad, bridge_button: dict[str, Any]) -> str
 def _get_button_name_from_triggers(keypad: LutronKeypad, button_number: int) -> str:
     """Retrieve the caseta button name from device triggers."""
     button_number_map = LEAP_TO_DEVICE_TYPE_SUBTYPE_MAP.get(keypad["type"], {})
-    return (
-        button_number_map.get(
-            button_number,
-            f"button {button_number}",
-        )
-        .replace("_", " ")
-        .title()
-    )
+    if (button_name := button_number_map.get(button_number)) is None:
+        button_name = f"button {button_number}"
+    return button_name.replace("_", " ").title()
 
 
 def _handle_none_keypad_serial(keypad_device: dict, bridge_serial: int) -> str:
@@ -405,13 +419,7 @@ def _handle_none_keypad_serial(keypad_device: dict, bridge_serial: int) -> str:
 @callback
 def async_get_lip_button(device_type: str, leap_button: int) -> int | None:
     """Get the LIP button for a given LEAP button."""
-    if (
-        lip_buttons_name_to_num := DEVICE_TYPE_SUBTYPE_MAP_TO_LIP.get(device_type)
-    ) is None or (
-        leap_button_num_to_name := LEAP_TO_DEVICE_TYPE_SUBTYPE_MAP.get(device_type)
-    ) is None:
-        return None
-    return lip_buttons_name_to_num[leap_button_num_to_name[leap_button]]
+    return DEVICE_TYPE_LEAP_TO_LIP.get((device_type, leap_button))
 
 
 @callback
@@ -424,11 +432,36 @@ def _async_subscribe_keypad_events(
 ):
     """Subscribe to lutron events."""
 
+    # Everything in a button event except the action is static for the
+    # button, so build that part of the event data once.
+    button_event_data: dict[int, dict[str, Any]] = {}
+    for button_id, button in keypad_buttons.items():
+        keypad = keypads[button[LUTRON_BUTTON_PARENT_KEYPAD]]
+        keypad_type = keypad[LUTRON_KEYPAD_TYPE]
+        keypad_device_id = keypad[LUTRON_KEYPAD_LUTRON_DEVICE_ID]
+        leap_button_number = button[LUTRON_BUTTON_LEAP_BUTTON_NUMBER]
+        if (
+            button_type := LEAP_TO_DEVICE_TYPE_SUBTYPE_MAP.get(
+                keypad_type, leap_to_keypad_button_names[keypad_device_id]
+            ).get(leap_button_number)
+        ) is None:
+            # The button is missing from the hard-coded triggers for this
+            # keypad type, no events are fired for it
+            continue
+        button_event_data[button_id] = {
+            ATTR_SERIAL: keypad[LUTRON_KEYPAD_SERIAL],
+            ATTR_TYPE: keypad_type,
+            ATTR_BUTTON_NUMBER: async_get_lip_button(keypad_type, leap_button_number),
+            ATTR_LEAP_BUTTON_NUMBER: leap_button_number,
+            ATTR_DEVICE_NAME: keypad[LUTRON_KEYPAD_NAME],
+            ATTR_DEVICE_ID: keypad[LUTRON_KEYPAD_DEVICE_REGISTRY_DEVICE_ID],
+            ATTR_AREA_NAME: keypad[LUTRON_KEYPAD_AREA_NAME],
+            ATTR_BUTTON_TYPE: button_type,
+        }
+
     @callback
     def _async_button_event(button_id, event_type):
-        if not (button := keypad_buttons.get(button_id)) or not (
-            keypad := keypads.get(button["parent_keypad"])
-        ):
+        if not (event_data := button_event_data.get(button_id)):
             return
 
         if event_type == BUTTON_STATUS_PRESSED:
@@ -436,35 +469,13 @@ def _async_subscribe_keypad_events(
         else:
             action = ACTION_RELEASE
 
-        keypad_type = keypad[LUTRON_KEYPAD_TYPE]
-        keypad_device_id = keypad[LUTRON_KEYPAD_LUTRON_DEVICE_ID]
-        leap_button_number = button[LUTRON_BUTTON_LEAP_BUTTON_NUMBER]
-        lip_button_number = async_get_lip_button(keypad_type, leap_button_number)
-        button_type = LEAP_TO_DEVICE_TYPE_SUBTYPE_MAP.get(
-            keypad_type, leap_to_keypad_button_names[keypad_device_id]
-        )[leap_button_number]
-
         hass.bus.async_fire(
-            LUTRON_CASETA_BUTTON_EVENT,
-            {
-                ATTR_SERIAL: keypad[LUTRON_KEYPAD_SERIAL],
-                ATTR_TYPE: keypad_type,
-                ATTR_BUTTON_NUMBER: lip_button_number,
-                ATTR_LEAP_BUTTON_NUMBER: leap_button_number,
-                ATTR_DEVICE_NAME: keypad[LUTRON_KEYPAD_NAME],
-                ATTR_DEVICE_ID: keypad[LUTRON_KEYPAD_DEVICE_REGISTRY_DEVICE_ID],
-                ATTR_AREA_NAME: keypad[LUTRON_KEYPAD_AREA_NAME],
-                ATTR_BUTTON_TYPE: button_type,
-                ATTR_ACTION: action,
-            },
+            LUTRON_CASETA_BUTTON_EVENT, {**event_data, ATTR_ACTION: action}
         )
 
     for button_id in keypad_buttons:
         bridge.add_button_subscriber(
-            str(button_id),
-            lambda event_type, button_id=button_id: _async_button_event(
-                button_id, event_type
-            ),
+            str(button_id), partial(_async_button_event, button_id)
         )
 
 
@@ -477,40 +488,34 @@ async def async_unload_entry(
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
-def _id_to_identifier(lutron_id: str) -> tuple[str, str]:
-    """Convert a lutron caseta identifier to a device identifier."""
-    return (DOMAIN, lutron_id)
-
-
 async def async_remove_config_entry_device(
     hass: HomeAssistant, entry: LutronCasetaConfigEntry, device_entry: dr.DeviceEntry
 ) -> bool:
     """Remove lutron_caseta config entry from a device."""
     data = entry.runtime_data
     bridge = data.bridge
-    devices = bridge.get_devices()
+    devices = bridge.devices
     buttons = bridge.buttons
     occupancy_groups = bridge.occupancy_groups
-    bridge_device = devices[BRIDGE_DEVICE_ID]
-    bridge_unique_id = serial_to_unique_id(bridge_device["serial"])
-    all_identifiers: set[tuple[str, str]] = {
+    bridge_unique_id = data.bridge_unique_id
+    occupancy_group_prefix = f"occupancygroup_{bridge_unique_id}_"
+    for domain, identifier in device_entry.identifiers:
+        if domain != DOMAIN:
+            continue
         # Base bridge
-        _id_to_identifier(bridge_unique_id),
+        if identifier == bridge_unique_id:
+            return False
         # Motion sensors and occupancy groups
-        *(
-            _id_to_identifier(
-                f"occupancygroup_{bridge_unique_id}_{device['occupancy_group_id']}"
-            )
-            for device in occupancy_groups.values()
-        ),
+        if isinstance(identifier, str) and identifier.startswith(
+            occupancy_group_prefix
+        ):
+            if identifier.removeprefix(occupancy_group_prefix) in occupancy_groups:
+                return False
+            continue
         # Button devices such as pico remotes and all other devices
-        *(
-            _id_to_identifier(device["serial"])
+        if any(
+            device["serial"] == identifier
             for device in chain(devices.values(), buttons.values())
-        ),
-    }
-    return not any(
-        identifier
-        for identifier in device_entry.identifiers
-        if identifier in all_identifiers
-    )
+        ):
+            return False
+    return True
@@ -45,14 +45,19 @@ class LutronOccupancySensor(LutronCasetaEntity, BinarySensorEntity):
     def __init__(self, device, data):
         """Init an occupancy sensor."""
         super().__init__(device, data)
-        area = area_name_from_id(self._smartbridge.areas, device["area"])
-        name = f"{area} {device['device_name']}"
-        self._attr_name = name
+        self._attr_unique_id = (
+            f"occupancygroup_{self._bridge_unique_id}_{self.device_id}"
+        )
+        area = area_name_from_id(
+            self._smartbridge.areas, device["area"], data.area_names
+        )
+        # The entity is the main feature of the device and uses its name
+        self._attr_name = None
         self._attr_device_info = DeviceInfo(
-            identifiers={(CASETA_DOMAIN, self.unique_id)},
+            identifiers={(CASETA_DOMAIN, self._attr_unique_id)},
             manufacturer=MANUFACTURER,
             model="Lutron Occupancy",
-            name=self.name,
+            name=f"{area} {device['device_name']}",
             via_device=(CASETA_DOMAIN, self._bridge_device["serial"]),
             configuration_url=CONFIG_URL,
             entry_type=DeviceEntryType.SERVICE,
@@ -76,13 +81,3 @@ class LutronOccupancySensor(LutronCasetaEntity, BinarySensorEntity):
     def device_id(self):
         """Return the device ID used for calling pylutron_caseta."""
         return self._device["occupancy_group_id"]
-
-    @property
-    def unique_id(self):
-        """Return a unique identifier."""
-        return f"occupancygroup_{self._bridge_unique_id}_{self.device_id}"
-
-    @property
-    def extra_state_attributes(self):
-        """Return the state attributes."""
-        return {"device_id": self.device_id}
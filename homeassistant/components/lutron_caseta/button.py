@@ -9,9 +9,8 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .device_trigger import LEAP_TO_DEVICE_TYPE_SUBTYPE_MAP
 from .entity import LutronCasetaEntity
-from .models import LutronCasetaConfigEntry, LutronCasetaData
+from .models import LUTRON_BUTTON_BUTTON_NAME, LutronCasetaConfigEntry, LutronCasetaData
 
 
 async def async_setup_entry(
@@ -21,48 +20,16 @@ async def async_setup_entry(
 ) -> None:
     """Set up Lutron pico and keypad buttons."""
     data = config_entry.runtime_data
-    bridge = data.bridge
-    button_devices = bridge.get_buttons()
-    all_devices = data.bridge.get_devices()
     keypads = data.keypad_data.keypads
-    entities: list[LutronCasetaButton] = []
-
-    for device in button_devices.values():
-        parent_keypad = keypads[device["parent_device"]]
-        parent_device_info = parent_keypad["device_info"]
-
-        enabled_default = True
-        if not (device_name := device.get("device_name")):
-            # device name (button name) is missing, probably a caseta pico
-            # try to get the name using the button number from the triggers
-            # disable the button by default
-            enabled_default = False
-            keypad_device = all_devices[device["parent_device"]]
-            button_numbers = LEAP_TO_DEVICE_TYPE_SUBTYPE_MAP.get(
-                keypad_device["type"],
-                {},
-            )
-            device_name = (
-                button_numbers.get(
-                    int(device["button_number"]),
-                    f"button {device['button_number']}",
-                )
-                .replace("_", " ")
-                .title()
-            )
-
-        # Append the child device name to the end of the parent keypad
-        # name to create the entity name
-        full_name = f'{parent_device_info.get("name")} {device_name}'
-        # Set the device_info to the same as the Parent Keypad
-        # The entities will be nested inside the keypad device
-        entities.append(
-            LutronCasetaButton(
-                device, data, full_name, enabled_default, parent_device_info
-            ),
+    # Set the device_info to the same as the Parent Keypad
+    # The entities will be nested inside the keypad device and the
+    # keypad name is prepended to the button name
+    async_add_entities(
+        LutronCasetaButton(
+            device, data, keypads[device["parent_device"]]["device_info"]
         )
-
-    async_add_entities(entities)
+        for device in data.bridge.get_buttons().values()
+    )
 
 
 class LutronCasetaButton(LutronCasetaEntity, ButtonEntity):
@@ -72,14 +39,18 @@ class LutronCasetaButton(LutronCasetaEntity, ButtonEntity):
         self,
         device: dict[str, Any],
         data: LutronCasetaData,
-        full_name: str,
-        enabled_default: bool,
         device_info: DeviceInfo,
     ) -> None:
         """Init a button entity."""
         super().__init__(device, data)
-        self._attr_entity_registry_enabled_default = enabled_default
-        self._attr_name = full_name
+        if not (name := device.get("device_name")):
+            # device name (button name) is missing, probably a caseta pico
+            # use the name resolved from the triggers during keypad setup
+            # and disable the button by default
+            self._attr_entity_registry_enabled_default = False
+            keypad_button = data.keypad_data.buttons[device["device_id"]]
+            name = keypad_button[LUTRON_BUTTON_BUTTON_NAME]
+        self._attr_name = name
         self._attr_device_info = device_info
 
     async def async_press(self) -> None:
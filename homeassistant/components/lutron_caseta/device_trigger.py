@@ -318,6 +318,14 @@ LEAP_TO_DEVICE_TYPE_SUBTYPE_MAP: dict[str, dict[int, str]] = {
     k: _reverse_dict(v) for k, v in DEVICE_TYPE_SUBTYPE_MAP_TO_LEAP.items()
 }
 
+DEVICE_TYPE_LEAP_TO_LIP: dict[tuple[str, int], int] = {
+    (device_type, leap_button): lip_buttons[subtype]
+    for device_type, leap_buttons in LEAP_TO_DEVICE_TYPE_SUBTYPE_MAP.items()
+    if (lip_buttons := DEVICE_TYPE_SUBTYPE_MAP_TO_LIP.get(device_type))
+    for leap_button, subtype in leap_buttons.items()
+    if subtype in lip_buttons
+}
+
 TRIGGER_SCHEMA = vol.Any(
     PICO_2_BUTTON_TRIGGER_SCHEMA,
     PICO_3_BUTTON_RAISE_LOWER_TRIGGER_SCHEMA,
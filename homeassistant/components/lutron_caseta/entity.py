@@ -11,7 +11,7 @@ from homeassistant.helpers.entity import Entity
 
 from .const import CONFIG_URL, DOMAIN, MANUFACTURER, UNASSIGNED_AREA
 from .models import LutronCasetaData
-from .util import area_name_from_id, serial_to_unique_id
+from .util import area_name_from_id
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,6 +19,7 @@ _LOGGER = logging.getLogger(__name__)
 class LutronCasetaEntity(Entity):
     """Common base class for all Lutron Caseta devices."""
 
+    _attr_has_entity_name = True
     _attr_should_poll = False
 
     def __init__(self, device: dict[str, Any], data: LutronCasetaData) -> None:
@@ -31,16 +32,24 @@ class LutronCasetaEntity(Entity):
         self._device = device
         self._smartbridge = data.bridge
         self._bridge_device = data.bridge_device
-        self._bridge_unique_id = serial_to_unique_id(data.bridge_device["serial"])
+        self._bridge_unique_id = data.bridge_unique_id
+        self._attr_extra_state_attributes = {"device_id": self.device_id}
+        if zone := device.get("zone"):
+            self._attr_extra_state_attributes["zone_id"] = zone
         if "serial" not in self._device:
             return
 
+        self._attr_unique_id = str(self._handle_none_serial(self.serial))
+
         if "parent_device" in device:
             # This is a child entity, handle the naming in button.py and switch.py
             return
-        area = area_name_from_id(self._smartbridge.areas, device["area"])
-        name = device["name"].split("_")[-1]
-        self._attr_name = full_name = f"{area} {name}"
+        area = area_name_from_id(
+            self._smartbridge.areas, device["area"], data.area_names
+        )
+        name = device["name"].rpartition("_")[2]
+        # The entity is the main feature of the device and uses its name
+        self._attr_name = None
         info = DeviceInfo(
             # Historically we used the device serial number for the identifier
             # but the serial is usually an integer and a string is expected
@@ -55,7 +64,7 @@ class LutronCasetaEntity(Entity):
             },
             manufacturer=MANUFACTURER,
             model=f"{device['model']} ({device['type']})",
-            name=full_name,
+            name=f"{area} {name}",
             via_device=(DOMAIN, self._bridge_device["serial"]),
             configuration_url=CONFIG_URL,
         )
@@ -83,21 +92,6 @@ class LutronCasetaEntity(Entity):
         """Return the serial number of the device."""
         return self._device["serial"]
 
-    @property
-    def unique_id(self) -> str:
-        """Return the unique ID of the device (serial)."""
-        return str(self._handle_none_serial(self.serial))
-
-    @property
-    def extra_state_attributes(self):
-        """Return the state attributes."""
-        attributes = {
-            "device_id": self.device_id,
-        }
-        if zone := self._device.get("zone"):
-            attributes["zone_id"] = zone
-        return attributes
-
 
 class LutronCasetaUpdatableEntity(LutronCasetaEntity):
     """A lutron_caseta entity that can update by syncing data from the bridge."""
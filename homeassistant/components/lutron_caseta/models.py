@@ -14,16 +14,18 @@ from homeassistant.helpers.device_registry import DeviceInfo
 type LutronCasetaConfigEntry = ConfigEntry[LutronCasetaData]
 
 
-@dataclass
+@dataclass(slots=True)
 class LutronCasetaData:
     """Data for the lutron_caseta integration."""
 
     bridge: Smartbridge
     bridge_device: dict[str, Any]
+    bridge_unique_id: str
     keypad_data: LutronKeypadData
+    area_names: dict[str, str]
 
 
-@dataclass
+@dataclass(slots=True)
 class LutronKeypadData:
     """Data for the lutron_caseta integration keypads."""
 
@@ -11,7 +11,6 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN as CASETA_DOMAIN
-from .util import serial_to_unique_id
 
 
 async def async_setup_entry(
@@ -27,22 +26,25 @@ async def async_setup_entry(
     data = config_entry.runtime_data
     bridge = data.bridge
     scenes = bridge.get_scenes()
-    async_add_entities(LutronCasetaScene(scenes[scene], data) for scene in scenes)
+    # All scenes belong to the bridge device, share a single device info
+    device_info = DeviceInfo(
+        identifiers={(CASETA_DOMAIN, data.bridge_device["serial"])},
+    )
+    async_add_entities(
+        LutronCasetaScene(scenes[scene], data, device_info) for scene in scenes
+    )
 
 
 class LutronCasetaScene(Scene):
     """Representation of a Lutron Caseta scene."""
 
-    def __init__(self, scene, data):
+    def __init__(self, scene, data, device_info: DeviceInfo) -> None:
         """Initialize the Lutron Caseta scene."""
         self._scene_id = scene["scene_id"]
         self._bridge: Smartbridge = data.bridge
-        bridge_unique_id = serial_to_unique_id(data.bridge_device["serial"])
-        self._attr_device_info = DeviceInfo(
-            identifiers={(CASETA_DOMAIN, data.bridge_device["serial"])},
-        )
+        self._attr_device_info = device_info
         self._attr_name = scene["name"]
-        self._attr_unique_id = f"scene_{bridge_unique_id}_{self._scene_id}"
+        self._attr_unique_id = f"scene_{data.bridge_unique_id}_{self._scene_id}"
 
     async def async_activate(self, **kwargs: Any) -> None:
         """Activate the scene."""
@@ -43,10 +43,10 @@ class LutronCasetaLight(LutronCasetaUpdatableEntity, SwitchEntity):
         keypads = data.keypad_data.keypads
         parent_keypad = keypads[device["parent_device"]]
         parent_device_info = parent_keypad["device_info"]
-        # Append the child device name to the end of the parent keypad name to create the entity name
-        self._attr_name = f'{parent_device_info["name"]} {device["device_name"]}'
+        self._attr_name = device["device_name"]
         # Set the device_info to the same as the Parent Keypad
-        # The entities will be nested inside the keypad device
+        # The entities will be nested inside the keypad device and the
+        # keypad name is prepended to the entity name
         self._attr_device_info = parent_device_info
 
     async def async_turn_on(self, **kwargs: Any) -> None:
@@ -10,22 +10,30 @@ def serial_to_unique_id(serial: int) -> str:
     return hex(serial)[2:].zfill(8)
 
 
-def area_name_from_id(areas: dict[str, dict], area_id: str | None) -> str:
-    """Return the full area name including parent(s)."""
+def area_name_from_id(
+    areas: dict[str, dict],
+    area_id: str | None,
+    area_names: dict[str, str],
+) -> str:
+    """Return the full area name including parent(s).
+
+    Resolved names are stored in area_names so each area is only walked once.
+    """
     if area_id is None:
         return UNASSIGNED_AREA
-    return _construct_area_name_from_id(areas, area_id, [])
 
-
-def _construct_area_name_from_id(
-    areas: dict[str, dict], area_id: str, labels: list[str]
-) -> str:
-    """Recursively construct the full area name including parent(s)."""
-    area = areas[area_id]
-    parent_area_id = area["parent_id"]
-    if parent_area_id is None:
-        # This is the root area, return last area
-        return " ".join(labels)
-
-    labels.insert(0, area["name"])
-    return _construct_area_name_from_id(areas, parent_area_id, labels)
+    # Walk up to the root area or to the first area with a known name
+    unresolved_area_ids: list[str] = []
+    parent_area_id: str | None = area_id
+    while parent_area_id is not None and parent_area_id not in area_names:
+        unresolved_area_ids.append(parent_area_id)
+        parent_area_id = areas[parent_area_id]["parent_id"]
+
+    # Build the names back down, the root area is not part of the name
+    area_name = "" if parent_area_id is None else area_names[parent_area_id]
+    for unresolved_area_id in reversed(unresolved_area_ids):
+        area = areas[unresolved_area_id]
+        if area["parent_id"] is not None:
+            area_name = f"{area_name} {area['name']}" if area_name else area["name"]
+        area_names[unresolved_area_id] = area_name
+    return area_name
@@ -110,6 +110,7 @@ class MockBridge:
         self.scenes = self.get_scenes()
         self.devices = self.load_devices()
         self.buttons = self.load_buttons()
+        self.button_subscribers = {}
 
     async def connect(self):
         """Connect the mock bridge."""
@@ -121,6 +122,7 @@ class MockBridge:
 
     def add_button_subscriber(self, button_id: str, callback_):
         """Mock a listener for button presses."""
+        self.button_subscribers[button_id] = callback_
 
     def is_connected(self):
         """Return whether the mock bridge is connected."""
@@ -0,0 +1,129 @@
+"""Tests for the Lutron Caseta integration setup."""
+
+from pylutron_caseta import BUTTON_STATUS_PRESSED
+import pytest
+
+from homeassistant.components.lutron_caseta import async_remove_config_entry_device
+from homeassistant.components.lutron_caseta.const import (
+    ACTION_PRESS,
+    ACTION_RELEASE,
+    ATTR_ACTION,
+    ATTR_AREA_NAME,
+    ATTR_BUTTON_NUMBER,
+    ATTR_BUTTON_TYPE,
+    ATTR_DEVICE_NAME,
+    ATTR_LEAP_BUTTON_NUMBER,
+    ATTR_SERIAL,
+    ATTR_TYPE,
+    DOMAIN,
+    LUTRON_CASETA_BUTTON_EVENT,
+)
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+
+from . import MockBridge, async_setup_integration
+
+from tests.common import async_capture_events
+
+
+class MockBridgeWithUnknownButton(MockBridge):
+    """Mock bridge with a pico button missing from the trigger map."""
+
+    def load_buttons(self):
+        """Load mock buttons into self.buttons."""
+        buttons = super().load_buttons()
+        buttons["112"] = {
+            "device_id": "112",
+            "current_state": "Release",
+            "button_number": 5,
+            "name": "Dining Room_Pico",
+            "type": "Pico3ButtonRaiseLower",
+            "model": "PJ2-3BRL-GXX-X01",
+            "serial": 68551522,
+            "parent_device": "9",
+        }
+        return buttons
+
+
+async def test_button_events(hass: HomeAssistant) -> None:
+    """Test button presses fire events with the static button data."""
+    config_entry = await async_setup_integration(hass, MockBridgeWithUnknownButton)
+    data = config_entry.runtime_data
+    bridge = data.bridge
+    keypad = data.keypad_data.keypads["9"]
+    events = async_capture_events(hass, LUTRON_CASETA_BUTTON_EVENT)
+
+    bridge.button_subscribers["111"](BUTTON_STATUS_PRESSED)
+    bridge.button_subscribers["111"]("Release")
+    await hass.async_block_till_done()
+
+    expected = {
+        ATTR_SERIAL: 68551522,
+        ATTR_TYPE: "Pico3ButtonRaiseLower",
+        ATTR_BUTTON_NUMBER: 3,
+        ATTR_LEAP_BUTTON_NUMBER: 1,
+        ATTR_DEVICE_NAME: "Pico",
+        ATTR_DEVICE_ID: keypad["dr_device_id"],
+        ATTR_AREA_NAME: "Dining Room",
+        ATTR_BUTTON_TYPE: "stop",
+    }
+    assert [event.data for event in events] == [
+        {**expected, ATTR_ACTION: ACTION_PRESS},
+        {**expected, ATTR_ACTION: ACTION_RELEASE},
+    ]
+
+    # Buttons missing from the hard-coded triggers fire no events
+    bridge.button_subscribers["112"](BUTTON_STATUS_PRESSED)
+    await hass.async_block_till_done()
+    assert len(events) == 2
+
+
+@pytest.mark.parametrize(
+    ("identifier", "can_remove"),
+    [
+        # Bridge unique id and bridge serial
+        ("000004d2", False),
+        (1234, False),
+        # Occupancy groups
+        ("occupancygroup_000004d2_2", False),
+        ("occupancygroup_000004d2_3", True),
+        ("occupancygroup_ffffffff_2", True),
+        # Devices
+        (5442321, False),
+        # Buttons
+        (11223344, False),
+        # Unknown devices
+        (99999999, True),
+        ("unknown", True),
+    ],
+)
+async def test_remove_config_entry_device(
+    hass: HomeAssistant, identifier: str | int, can_remove: bool
+) -> None:
+    """Test only devices no longer on the bridge can be removed."""
+    config_entry = await async_setup_integration(hass, MockBridge)
+    bridge = config_entry.runtime_data.bridge
+    bridge.occupancy_groups = {
+        "2": {"occupancy_group_id": "2", "status": "Unknown", "area": "1205"}
+    }
+    bridge.buttons["113"] = {
+        "device_id": "113",
+        "button_number": 0,
+        "serial": 11223344,
+        "parent_device": "9",
+    }
+
+    device_entry = dr.DeviceEntry(identifiers={(DOMAIN, identifier)})
+    assert (
+        await async_remove_config_entry_device(hass, config_entry, device_entry)
+        is can_remove
+    )
+
+
+async def test_remove_config_entry_device_other_domain(hass: HomeAssistant) -> None:
+    """Test identifiers from other integrations are ignored."""
+    config_entry = await async_setup_integration(hass, MockBridge)
+
+    device_entry = dr.DeviceEntry(identifiers={("other", 5442321)})
+    assert await async_remove_config_entry_device(hass, config_entry, device_entry)
@@ -0,0 +1,78 @@
+"""Tests for the Lutron Caseta utilities."""
+
+from homeassistant.components.lutron_caseta.const import UNASSIGNED_AREA
+from homeassistant.components.lutron_caseta.util import area_name_from_id
+
+AREAS = {
+    "1": {"id": "1", "name": "House", "parent_id": None},
+    "2": {"id": "2", "name": "Upstairs", "parent_id": "1"},
+    "3": {"id": "3", "name": "Bedroom", "parent_id": "2"},
+    "4": {"id": "4", "name": "Closet", "parent_id": "3"},
+    "5": {"id": "5", "name": "Bathroom", "parent_id": "2"},
+    "6": {"id": "6", "name": "Downstairs", "parent_id": "1"},
+    "7": {"id": "7", "name": "Kitchen", "parent_id": "6"},
+    "8": {"id": "8", "name": "Pantry", "parent_id": "7"},
+}
+
+
+def _recursive_area_name_from_id(areas: dict[str, dict], area_id: str | None) -> str:
+    """Return the full area name the way it was resolved before caching."""
+    if area_id is None:
+        return UNASSIGNED_AREA
+    labels: list[str] = []
+    while (parent_area_id := areas[area_id]["parent_id"]) is not None:
+        labels.insert(0, areas[area_id]["name"])
+        area_id = parent_area_id
+    return " ".join(labels)
+
+
+def test_area_name_from_id_root_area() -> None:
+    """Test the root area is not part of the name."""
+    area_names: dict[str, str] = {}
+    assert area_name_from_id(AREAS, "1", area_names) == ""
+    assert area_names == {"1": ""}
+
+
+def test_area_name_from_id_unassigned() -> None:
+    """Test devices without an area use the unassigned area."""
+    area_names: dict[str, str] = {}
+    assert area_name_from_id(AREAS, None, area_names) == UNASSIGNED_AREA
+    assert area_names == {}
+
+
+def test_area_name_from_id_deep_chain() -> None:
+    """Test every area on the way up is named and cached."""
+    area_names: dict[str, str] = {}
+    assert area_name_from_id(AREAS, "4", area_names) == "Upstairs Bedroom Closet"
+    assert area_names == {
+        "1": "",
+        "2": "Upstairs",
+        "3": "Upstairs Bedroom",
+        "4": "Upstairs Bedroom Closet",
+    }
+
+
+def test_area_name_from_id_cache_hit() -> None:
+    """Test the walk stops at the first area with a cached name."""
+    areas = {**AREAS, "1": {"id": "1", "name": "Unused", "parent_id": "missing"}}
+    area_names = {"2": "Cached Upstairs"}
+    assert area_name_from_id(areas, "4", area_names) == "Cached Upstairs Bedroom Closet"
+    assert area_names == {
+        "2": "Cached Upstairs",
+        "3": "Cached Upstairs Bedroom",
+        "4": "Cached Upstairs Bedroom Closet",
+    }
+
+
+def test_area_name_from_id_matches_uncached() -> None:
+    """Test cached area names match resolving every area from scratch."""
+    area_names: dict[str, str] = {}
+    for _ in range(2):
+        for area_id in (*reversed(AREAS), None):
+            assert area_name_from_id(
+                AREAS, area_id, area_names
+            ) == _recursive_area_name_from_id(AREAS, area_id)
+
+    assert area_names == {
+        area_id: _recursive_area_name_from_id(AREAS, area_id) for area_id in AREAS
+    }